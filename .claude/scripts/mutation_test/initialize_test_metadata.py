@@ -7,7 +7,8 @@ This script performs one-time initialization on fresh all_types.json files:
 2. Initializes test metadata (test_status, batch_number, fail_reason)
 
 It's idempotent: if already initialized, exits early with success.
-Always called by prepare.py before batch processing.
+Always run by prepare.py before batch processing (in-process via
+initialize_all_types, so no separate interpreter is started).
 
 Usage:
   python3 initialize_test_metadata.py --file .claude/transient/all_types.json
@@ -16,6 +17,7 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any, cast
@@ -219,6 +221,64 @@ def initialize_test_metadata(data: AllTypesData) -> tuple[int, int]:
     return auto_passed, untested
 
 
+def initialize_all_types(
+    data: AllTypesData, file_path: Path, dry_run: bool = False
+) -> bool:
+    """
+    Deduplicate, validate and initialize data, then write it back to file_path.
+
+    Progress and results are reported on stderr. Callers are expected to have
+    checked is_already_initialized() first.
+
+    Args:
+        data: AllTypesData containing type_guide (modified in place)
+        file_path: Path to write the initialized data to
+        dry_run: Preview changes without modifying the file
+
+    Returns:
+        False if deduplication validation failed (nothing is written), True otherwise
+    """
+    print("Initializing test metadata...", file=sys.stderr)
+
+    # Step 1: Deduplicate mutation paths
+    data, duplicates_marked = deduplicate_mutation_paths(data)
+    if duplicates_marked > 0:
+        print(
+            f"✓ Deduplicated {duplicates_marked} mutation paths (testing representatives only)",
+            file=sys.stderr,
+        )
+
+    # Step 2: Validate deduplication
+    validation_success, validation_errors = validate_deduplication_data(data)
+    if not validation_success:
+        print("✗ Deduplication validation FAILED:", file=sys.stderr)
+        for error in validation_errors:
+            print(f"  {error}", file=sys.stderr)
+        return False
+
+    # Step 3: Initialize test metadata
+    auto_passed, untested = initialize_test_metadata(data)
+
+    # Write back unless dry run
+    if not dry_run:
+        # Serialize first, then swap in a temp file so a failed write can't corrupt it
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            _ = f.write(json.dumps(data, indent=2))
+        os.replace(tmp_path, file_path)
+        print(f"✅ Initialized test metadata in {file_path}", file=sys.stderr)
+    else:
+        print(f"🔍 Dry run - no changes made to {file_path}", file=sys.stderr)
+
+    # Report results
+    print("", file=sys.stderr)
+    print("Test Metadata Initialization Results:", file=sys.stderr)
+    print(f"  Auto-passed: {auto_passed} types", file=sys.stderr)
+    print(f"  Untested: {untested} types", file=sys.stderr)
+    print(f"  Total: {auto_passed + untested} types", file=sys.stderr)
+    return True
+
+
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -261,42 +321,9 @@ def main() -> None:
         print("✓ Already initialized (skipping)", file=sys.stderr)
         sys.exit(0)
 
-    print("Initializing test metadata...", file=sys.stderr)
-
-    # Step 1: Deduplicate mutation paths
-    data, duplicates_marked = deduplicate_mutation_paths(data)
-    if duplicates_marked > 0:
-        print(
-            f"✓ Deduplicated {duplicates_marked} mutation paths (testing representatives only)",
-            file=sys.stderr,
-        )
-
-    # Step 2: Validate deduplication
-    validation_success, validation_errors = validate_deduplication_data(data)
-    if not validation_success:
-        print("✗ Deduplication validation FAILED:", file=sys.stderr)
-        for error in validation_errors:
-            print(f"  {error}", file=sys.stderr)
+    if not initialize_all_types(data, file_path, dry_run):
         sys.exit(1)
 
-    # Step 3: Initialize test metadata
-    auto_passed, untested = initialize_test_metadata(data)
-
-    # Write back unless dry run
-    if not dry_run:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        print(f"✅ Initialized test metadata in {file_path}", file=sys.stderr)
-    else:
-        print(f"🔍 Dry run - no changes made to {file_path}", file=sys.stderr)
-
-    # Report results
-    print("", file=sys.stderr)
-    print("Test Metadata Initialization Results:", file=sys.stderr)
-    print(f"  Auto-passed: {auto_passed} types", file=sys.stderr)
-    print(f"  Untested: {untested} types", file=sys.stderr)
-    print(f"  Total: {auto_passed + untested} types", file=sys.stderr)
-
 
 if __name__ == "__main__":
     main()
@@ -18,12 +18,14 @@ Usage:
     --mcp-response -
 """
 
-import argparse
 import json
+import os
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TypedDict, cast
+from types import SimpleNamespace
+from typing import Any, NoReturn, TypedDict, cast
 
 # Add script directory to path for imports
 script_dir = Path(__file__).parent
@@ -77,35 +79,79 @@ class TestPlan(TypedDict):
     tests: list[dict[str, Any]]  # pyright: ignore[reportExplicitAny]
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Unified operation manager for mutation testing"
-    )
-    _ = parser.add_argument(
-        "--port", type=int, required=True, help="Port number (used to locate test plan file)"
-    )
-    _ = parser.add_argument(
-        "--action",
-        required=True,
-        choices=["get-next", "update"],
-        help="Action to perform: get-next or update",
-    )
+# Fixed CLI surface: flag -> (attribute name, value converter)
+ARG_SPEC: dict[str, tuple[str, Callable[[str], object]]] = {
+    "--port": ("port", int),
+    "--action": ("action", str),
+    "--tool-name": ("tool_name", str),
+    "--mcp-response": ("mcp_response", str),
+}
+REQUIRED_ARGS = ("--port", "--action")
+ACTION_CHOICES = ("get-next", "update")
+USAGE = (
+    "usage: operation_manager.py --port PORT --action {get-next,update} "
+    + "[--tool-name TOOL_NAME] [--mcp-response MCP_RESPONSE]"
+)
 
-    # Update-specific arguments
-    _ = parser.add_argument(
-        "--tool-name",
-        help="MCP tool name (required for update action)",
-    )
-    _ = parser.add_argument(
-        "--mcp-response",
-        help="Full MCP response JSON (use '-' for stdin, required for update action)",
-    )
 
-    return parser.parse_args()
+def arg_error(message: str) -> NoReturn:
+    """Report a command line error the way argparse would and exit with status 2."""
+    print(USAGE, file=sys.stderr)
+    print(f"operation_manager.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
 
 
-def validate_args(args: argparse.Namespace) -> None:
+def parse_args(argv: list[str] | None = None) -> SimpleNamespace:
+    """
+    Parse command line arguments.
+
+    Hand-rolled over the small fixed CLI instead of argparse: this script runs once
+    per operation, so argparse's import and parser construction would be paid on
+    every call. Accepts both `--flag value` and `--flag=value`.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    values: dict[str, object] = {name: None for name, _ in ARG_SPEC.values()}
+
+    idx = 0
+    while idx < len(args):
+        arg = args[idx]
+        if arg in ("-h", "--help"):
+            print(USAGE)
+            print(__doc__)
+            sys.exit(0)
+
+        flag, has_inline_value, inline_value = arg.partition("=")
+        spec = ARG_SPEC.get(flag)
+        if spec is None:
+            arg_error(f"unrecognized arguments: {arg}")
+
+        if has_inline_value:
+            raw_value = inline_value
+        else:
+            idx += 1
+            if idx >= len(args):
+                arg_error(f"argument {flag}: expected one argument")
+            raw_value = args[idx]
+
+        name, convert = spec
+        try:
+            values[name] = convert(raw_value)
+        except ValueError:
+            arg_error(f"argument {flag}: invalid value: '{raw_value}'")
+        idx += 1
+
+    missing = [flag for flag in REQUIRED_ARGS if values[ARG_SPEC[flag][0]] is None]
+    if missing:
+        arg_error(f"the following arguments are required: {', '.join(missing)}")
+
+    if values["action"] not in ACTION_CHOICES:
+        choices = ", ".join(f"'{choice}'" for choice in ACTION_CHOICES)
+        arg_error(f"argument --action: invalid choice: '{values['action']}' (choose from {choices})")
+
+    return SimpleNamespace(**values)
+
+
+def validate_args(args: SimpleNamespace) -> None:
     """Validate argument combinations."""
     action = cast(str, args.action)
 
@@ -127,12 +173,32 @@ def get_plan_file_path(port: int, config: MutationTestConfig) -> str:
     return config["test_plan_file_pattern"].format(port=port)
 
 
+def read_file_bytes(file_path: str) -> bytes:
+    """
+    Read a whole file with a single raw read, bypassing the Python io layers.
+
+    Uses O_NOATIME where available so the read does not dirty the inode; falls back
+    to a plain open when the kernel refuses it (file not owned by the caller).
+    """
+    flags = os.O_RDONLY
+    noatime = getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(file_path, flags | noatime)
+    except PermissionError:
+        if not noatime:
+            raise
+        fd = os.open(file_path, flags)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
 def load_test_plan(file_path: str) -> TestPlan:
     """Load test plan from file."""
     try:
-        with open(file_path, encoding="utf-8") as f:
-            test_plan_raw = json.load(f)  # pyright: ignore[reportAny]
-            return cast(TestPlan, test_plan_raw)
+        test_plan_raw = json.loads(read_file_bytes(file_path))  # pyright: ignore[reportAny]
+        return cast(TestPlan, test_plan_raw)
     except FileNotFoundError:
         print(f"Error: Test plan file not found: {file_path}", file=sys.stderr)
         sys.exit(1)
@@ -151,6 +217,20 @@ def save_test_plan(file_path: str, test_plan: TestPlan) -> None:
         sys.exit(1)
 
 
+def append_log_lines(lines: list[str], log_file: str = MUTATION_TEST_LOG) -> None:
+    """
+    Append complete lines to the debug log in a single writev call.
+
+    Each line is encoded separately and handed to the kernel as one iovec, so the
+    whole group lands in one O_APPEND write without joining it in Python first.
+    """
+    fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        _ = os.writev(fd, [line.encode("utf-8") for line in lines])
+    finally:
+        os.close(fd)
+
+
 def skip_remaining_operations_in_test(
     test: dict[str, Any],  # pyright: ignore[reportExplicitAny]
     reason: str,
@@ -320,11 +400,11 @@ def parse_mcp_response_with_input(
         # Subagent mistakenly called --action update for previous operation
         # Hook already handled the update correctly, so this is just informational
         try:
-            with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                prior_op_id = operation_id - 1
-                _ = f.write(f"[{timestamp}] port={port} op_id={prior_op_id} subagent mistakenly called update\n")
-                f.flush()
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            prior_op_id = operation_id - 1
+            append_log_lines(
+                [f"[{timestamp}] port={port} op_id={prior_op_id} subagent mistakenly called update\n"]
+            )
         except Exception:
             pass
         empty_dict: dict[str, object] = {}
@@ -350,10 +430,9 @@ def handle_test_failure(
 
     # Log the skip with type name
     try:
-        with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-            _ = f.write(
-                f"[{timestamp}] port={port} ** SKIPPING TYPE: {type_name} ** {reason} at op_id={operation_id}\n"
-            )
+        append_log_lines(
+            [f"[{timestamp}] port={port} ** SKIPPING TYPE: {type_name} ** {reason} at op_id={operation_id}\n"]
+        )
     except Exception:
         pass
 
@@ -369,8 +448,7 @@ def handle_test_failure(
     if next_operation is None:
         # No more tests to run - all done
         try:
-            with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                _ = f.write(f"[{timestamp}] port={port} ** FINISHED **\n")
+            append_log_lines([f"[{timestamp}] port={port} ** FINISHED **\n"])
         except Exception:
             pass
         print(json.dumps({"status": "finished"}, indent=2))
@@ -379,9 +457,7 @@ def handle_test_failure(
     # Provide next operation from next test
     next_op_id = cast(int, next_operation.get("operation_id"))
     try:
-        with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-            _ = f.write(f"[{timestamp}] port={port} op_id={next_op_id} provided to subagent\n")
-            f.flush()
+        append_log_lines([f"[{timestamp}] port={port} op_id={next_op_id} provided to subagent\n"])
     except Exception:
         pass
 
@@ -444,10 +520,12 @@ def check_and_log_timeouts(
                 # Only log timeout if we haven't already logged it for this port
                 if check_port not in already_logged_timeout:
                     try:
-                        with open(log_file, "a", encoding="utf-8") as f:
-                            _ = f.write(
+                        append_log_lines(
+                            [
                                 f"[{timestamp}] port={check_port} ** TERMINATED (TIMEOUT) ** - No activity for {time_since_activity:.0f} seconds\n"
-                            )
+                            ],
+                            log_file,
+                        )
                     except Exception:
                         pass
 
@@ -573,13 +651,12 @@ def action_get_next(port: int) -> None:
 
                 if should_log_elapsed:
                     try:
-                        with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                            elapsed = now - start_time
-                            total_seconds = int(elapsed.total_seconds())
-                            hours = total_seconds // 3600
-                            minutes = (total_seconds % 3600) // 60
-                            seconds = total_seconds % 60
-                            _ = f.write(f"[{timestamp}] ** ELAPSED: {hours}h {minutes}m {seconds}s **\n")
+                        elapsed = now - start_time
+                        total_seconds = int(elapsed.total_seconds())
+                        hours = total_seconds // 3600
+                        minutes = (total_seconds % 3600) // 60
+                        seconds = total_seconds % 60
+                        append_log_lines([f"[{timestamp}] ** ELAPSED: {hours}h {minutes}m {seconds}s **\n"])
                     except Exception:
                         pass
 
@@ -595,8 +672,9 @@ def action_get_next(port: int) -> None:
     # Block requests if: test complete, port finished, or hard terminated (non-timeout)
     if test_complete or port_finished or port_hard_terminated:
         try:
-            with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                _ = f.write(f"[{timestamp}] port={port} ** REQUEST AFTER TERMINATION ** - Returning finished status\n")
+            append_log_lines(
+                [f"[{timestamp}] port={port} ** REQUEST AFTER TERMINATION ** - Returning finished status\n"]
+            )
         except Exception:
             pass
         print(json.dumps({"status": "finished"}, indent=2))
@@ -605,8 +683,9 @@ def action_get_next(port: int) -> None:
     # Resume after timeout - subagent is still alive
     if port_timeout_terminated:
         try:
-            with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                _ = f.write(f"[{timestamp}] port={port} ** RESUMING AFTER TIMEOUT ** - Subagent is still active\n")
+            append_log_lines(
+                [f"[{timestamp}] port={port} ** RESUMING AFTER TIMEOUT ** - Subagent is still active\n"]
+            )
         except Exception:
             pass
 
@@ -618,9 +697,8 @@ def action_get_next(port: int) -> None:
     if operation is None:
         # All operations complete for this subagent
         try:
-            # Write FINISHED marker and close file before reading
-            with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                _ = f.write(f"[{timestamp}] port={port} ** FINISHED **\n")
+            # Write FINISHED marker before reading
+            append_log_lines([f"[{timestamp}] port={port} ** FINISHED **\n"])
 
             # Check if all other subagents are also complete (purely log-based)
             # Parse log to find which ports participated and which finished
@@ -778,26 +856,33 @@ def action_get_next(port: int) -> None:
                 # Write summary statistics for each subagent
                 total_success = 0
                 total_fail = 0
-                with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-                    if port_stats:
-                        _ = f.write(f"[{timestamp}] Subagent Summary:\n")
-                        for subagent_port in sorted(port_stats.keys()):
-                            success_count = port_stats[subagent_port]["SUCCESS"]
-                            fail_count = port_stats[subagent_port]["FAIL"]
-                            _ = f.write(f"[{timestamp}]   port={subagent_port}: SUCCESS={success_count}, FAIL={fail_count}\n")
-                            total_success += success_count
-                            total_fail += fail_count
-
-                    _ = f.write(f"[{timestamp}] ** MUTATION TEST COMPLETE **{duration_str}\n")
-
-                    # Output overall test results
-                    if timed_out_ports:
-                        timeout_port_list = ", ".join(str(p) for p in sorted(timed_out_ports))
-                        _ = f.write(f"[{timestamp}] INCOMPLETE - {len(timed_out_ports)} subagent(s) timed out (ports: {timeout_port_list})\n")
-                    elif total_fail == 0 and total_success > 0:
-                        _ = f.write(f"[{timestamp}] ALL TESTS PASSED\n")
-                    elif total_success > 0 or total_fail > 0:
-                        _ = f.write(f"[{timestamp}] Tests Passed: {total_success}, Tests Failed: {total_fail}\n")
+                summary_lines: list[str] = []
+                if port_stats:
+                    summary_lines.append(f"[{timestamp}] Subagent Summary:\n")
+                    for subagent_port in sorted(port_stats.keys()):
+                        success_count = port_stats[subagent_port]["SUCCESS"]
+                        fail_count = port_stats[subagent_port]["FAIL"]
+                        summary_lines.append(
+                            f"[{timestamp}]   port={subagent_port}: SUCCESS={success_count}, FAIL={fail_count}\n"
+                        )
+                        total_success += success_count
+                        total_fail += fail_count
+
+                summary_lines.append(f"[{timestamp}] ** MUTATION TEST COMPLETE **{duration_str}\n")
+
+                # Output overall test results
+                if timed_out_ports:
+                    timeout_port_list = ", ".join(str(p) for p in sorted(timed_out_ports))
+                    summary_lines.append(
+                        f"[{timestamp}] INCOMPLETE - {len(timed_out_ports)} subagent(s) timed out (ports: {timeout_port_list})\n"
+                    )
+                elif total_fail == 0 and total_success > 0:
+                    summary_lines.append(f"[{timestamp}] ALL TESTS PASSED\n")
+                elif total_success > 0 or total_fail > 0:
+                    summary_lines.append(
+                        f"[{timestamp}] Tests Passed: {total_success}, Tests Failed: {total_fail}\n"
+                    )
+                append_log_lines(summary_lines)
         except Exception:
             # Silently ignore debug log write failures
             pass
@@ -867,10 +952,10 @@ def action_get_next(port: int) -> None:
     save_test_plan(file_path, test_plan)
 
     try:
-        with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-            attempt_suffix = f" (attempt {operation['times_provided']})" if operation['times_provided'] > 1 else ""
-            _ = f.write(f"[{timestamp}] port={port} op_id={operation_id} provided to subagent{attempt_suffix}\n")
-            f.flush()  # Explicitly flush to ensure write happens
+        attempt_suffix = f" (attempt {operation['times_provided']})" if operation['times_provided'] > 1 else ""
+        append_log_lines(
+            [f"[{timestamp}] port={port} op_id={operation_id} provided to subagent{attempt_suffix}\n"]
+        )
     except Exception:
         # Silently ignore debug log write failures
         pass
@@ -944,16 +1029,15 @@ def action_update(
     try:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         short_tool = shorten_tool_name(tool_name)
-        with open(MUTATION_TEST_LOG, "a", encoding="utf-8") as f:
-            _ = f.write(
-                f"[{timestamp}] port={port} op_id={operation_id} status={status} tool={short_tool}\n"
-            )
-            if status == "FAIL" and error:
-                _ = f.write(f"[{timestamp}] port={port} op_id={operation_id} error={error}\n")
-                # Log the actual parameters that were passed to the failing operation
-                params_json = json.dumps(tool_input, separators=(",", ":"))
-                _ = f.write(f"[{timestamp}] port={port} op_id={operation_id} params={params_json}\n")
-            f.flush()
+        log_lines = [
+            f"[{timestamp}] port={port} op_id={operation_id} status={status} tool={short_tool}\n"
+        ]
+        if status == "FAIL" and error:
+            log_lines.append(f"[{timestamp}] port={port} op_id={operation_id} error={error}\n")
+            # Log the actual parameters that were passed to the failing operation
+            params_json = json.dumps(tool_input, separators=(",", ":"))
+            log_lines.append(f"[{timestamp}] port={port} op_id={operation_id} params={params_json}\n")
+        append_log_lines(log_lines)
     except Exception:
         # Silently ignore debug log write failures
         pass
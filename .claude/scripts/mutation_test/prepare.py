@@ -16,12 +16,11 @@ Output:
   Returns AllAssignmentsOutput with assignments and test plan files.
 """
 
-import glob
 import json
 import os
-import subprocess
 import sys
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, TypedDict, cast
@@ -40,6 +39,15 @@ from config import (  # noqa: E402
     get_mutation_test_log,
     load_config,
 )
+from initialize_test_metadata import (  # noqa: E402
+    initialize_all_types,
+    is_already_initialized,
+)
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
 
 # Type alias for backward compatibility
 TypeGuideRoot = AllTypesData
@@ -47,6 +55,19 @@ MutationConfig = MutationTestConfig
 
 # Constants
 OPERATION_ID_START = 1  # Operation IDs start at 1 for better human readability
+COMPLETED_STATUSES = frozenset({"passed", "auto_passed"})
+
+# Single-letter category shown in debug log type descriptions
+MUTATION_TYPE_CATEGORIES: dict[str | None, str] = {"Component": "C", "Resource": "R"}
+
+# MCP tool names used in generated test operations
+SPAWN_ENTITY_TOOL = "mcp__brp__world_spawn_entity"
+INSERT_RESOURCES_TOOL = "mcp__brp__world_insert_resources"
+QUERY_TOOL = "mcp__brp__world_query"
+MUTATE_COMPONENTS_TOOL = "mcp__brp__world_mutate_components"
+MUTATE_RESOURCES_TOOL = "mcp__brp__world_mutate_resources"
+SPAWN_TOOLS = frozenset({SPAWN_ENTITY_TOOL, INSERT_RESOURCES_TOOL})
+MUTATE_TOOLS = frozenset({MUTATE_COMPONENTS_TOOL, MUTATE_RESOURCES_TOOL})
 
 
 # Type definitions for JSON structures (extends config.py's TypeData)
@@ -118,6 +139,7 @@ class TestOperation(TypedDict, total=False):
     resource: str | None
     path: str | None
     value: object
+    is_root_example: bool  # Root mutation that establishes the enum variant
     # Entity ID substitution - placeholder value to replace
     entity_id_substitution: int | None
 
@@ -146,6 +168,54 @@ class OperationIndices(TypedDict):
     mutation_start_idx: int | None
 
 
+class BatchStatistics(TypedDict):
+    """Type guide statistics reported after batch renumbering."""
+
+    total: int
+    passed: int
+    failed: int
+    untested: int
+    max_batch: int
+    changed: bool  # Whether renumbering left any status or batch number different
+
+
+class TypeWithOps(TypedDict):
+    """A batch type with its generated operations, ready for distribution."""
+
+    type_data: TypeDataComplete
+    all_operations: list[TestOperation]
+    operation_indices: OperationIndices
+    ops_needed: int
+
+
+def load_json_bytes(raw: bytes) -> object:
+    """
+    Parse JSON bytes, using orjson when it is installed.
+
+    Falls back to stdlib json when orjson is unavailable or rejects the input
+    (orjson only handles 64-bit integers), so both paths raise json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)  # pyright: ignore[reportAny]
+        except orjson.JSONDecodeError:  # pyright: ignore[reportAny]
+            pass
+    return json.loads(raw)  # pyright: ignore[reportAny]
+
+
+def dump_json_bytes(obj: object, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (indented unless indent=False), preferring orjson."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0  # pyright: ignore[reportAny]
+            return orjson.dumps(obj, option=option)  # pyright: ignore[reportAny]
+        except orjson.JSONEncodeError:  # pyright: ignore[reportAny]
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 # Load configuration from config file
 try:
     mutation_config = load_config()
@@ -167,15 +237,6 @@ if not os.path.exists(json_file):
     print(f"Error: {json_file} not found!", file=sys.stderr)
     sys.exit(1)
 
-# Load all_types.json to discover current batch
-try:
-    with open(json_file, "r", encoding="utf-8") as f:
-        all_types_raw = json.load(f)  # pyright: ignore[reportAny]
-        all_types_data: dict[str, object] = all_types_raw  # pyright: ignore[reportAny]
-except json.JSONDecodeError as e:
-    print(f"Error parsing JSON: {e}", file=sys.stderr)
-    sys.exit(1)
-
 # Batch number will be discovered after renumbering
 batch_num: int = -1  # Placeholder, will be set after renumbering
 
@@ -186,7 +247,7 @@ def renumber_batches(
     max_subagents: int,
     ops_per_subagent: int,
     excluded_type_names: set[str],
-) -> AllTypesData:
+) -> tuple[AllTypesData, dict[int, list[TypeDataComplete]], BatchStatistics]:
     """
     Pack ALL untested types into batches in a single pass.
 
@@ -204,78 +265,85 @@ def renumber_batches(
         max_subagents: Maximum number of subagents per batch
         ops_per_subagent: Operation capacity per subagent
         excluded_type_names: Set of type names to exclude from testing
+
+    Returns:
+        Tuple of (data, batches_index, statistics) where batches_index maps each newly
+        assigned batch number to its complete type data (with mutation_type) in
+        type_guide order and statistics holds the status counts and highest batch number
     """
     type_guide = data["type_guide"]
+    batches_index: dict[int, list[TypeDataComplete]] = {}
 
-    # Step 1: Reset failed tests to untested and clear their batch numbers
+    # Steps 1-3 in a single pass over the type guide:
+    # 1. Reset failed tests to untested (except excluded types)
+    # 2. Find highest batch number assigned to passed/auto-passed tests
+    # 3. Clear batch numbers for ALL untested types (including just-reset ones)
+    # Untested, non-excluded types are collected for packing in the same pass.
+    max_batch = 0
+    untested_types: list[tuple[str, TypeData]] = []
+    any_changes = False  # Set when a status is reset or a batch number is assigned
+    status_reset = False
+    # Batch numbers of untested types before they are cleared, to detect real changes
+    previous_batch_numbers: dict[str, int | None] = {}
     for type_name, type_data in type_guide.items():
-        if type_name in excluded_type_names:
-            continue
-        if type_data.get("test_status") == "failed":
+        test_status = type_data.get("test_status")
+        if test_status == "failed" and type_name not in excluded_type_names:
             type_data["test_status"] = "untested"
             type_data["fail_reason"] = ""
-            type_data["batch_number"] = None
+            test_status = "untested"
+            any_changes = True
+            status_reset = True
 
-    # Step 2: Find highest batch number assigned to passed/auto-passed tests
-    max_batch = 0
-    for type_data in type_guide.values():
-        if type_data.get("test_status") in ["passed", "auto_passed"]:
+        if test_status in COMPLETED_STATUSES:
             batch_num = type_data.get("batch_number")
             if batch_num is not None and batch_num > max_batch:
                 max_batch = batch_num
-
-    # Step 3: Clear batch numbers for ALL untested types
-    for type_data in type_guide.values():
-        if type_data.get("test_status") == "untested":
+        elif test_status == "untested":
+            previous_batch_numbers[type_name] = type_data.get("batch_number")
             type_data["batch_number"] = None
+            if type_name not in excluded_type_names:
+                untested_types.append((type_name, type_data))
+
+    # Size every untested type once up front - mutation_type and the operation
+    # count don't change between batch passes. Oversized types are skipped here.
+    pending_types: list[tuple[TypeDataComplete, int]] = []
+    for type_name, type_data_raw in untested_types:
+        # Extract mutation_type from schema_info
+        schema_info = type_data_raw.get("schema_info")
+        mutation_type = extract_mutation_type(schema_info)
+
+        # Build complete type_data with mutation_type (reused when its batch is prepared)
+        type_data = build_type_data_complete(type_name, type_data_raw, mutation_type)
+
+        # Calculate operations needed for this type
+        ops_needed = calculate_type_operations(type_data)
+
+        # Check if type can fit in empty batch (sanity check - warn if not in current batch)
+        if ops_needed > batch_capacity:
+            print(
+                f"Warning: Type '{type_name}' requires {ops_needed} operations "
+                + f"but batch capacity is only {batch_capacity} operations. "
+                + "This type will be skipped. Increase max_subagents or ops_per_subagent in config."
+            )
+            type_guide[type_name]["batch_number"] = -1  # Mark as skipped
+            any_changes = True
+            continue
 
-    # Step 4: Pack ALL untested types into batches (single pass)
-    untested_types: list[tuple[str, TypeData]] = [
-        (type_name, type_data)
-        for type_name, type_data in type_guide.items()
-        if type_data.get("test_status") == "untested"
-        and type_name not in excluded_type_names
-    ]
+        pending_types.append((type_data, ops_needed))
 
+    # Step 4: Pack ALL untested types into batches
     current_batch = max_batch + 1
     current_subagent_idx = 0  # 0-indexed within batch
     current_ops_in_subagent = 0  # Operations used in current subagent
 
-    # Pack all types into batches - loop until nothing left to pack
-    while True:
-        packed_any_in_batch = False
-        type_idx = 0
-
-        while type_idx < len(untested_types):
-            type_name, type_data_raw = untested_types[type_idx]
-
-            # Skip if already assigned to a batch
-            if type_guide[type_name].get("batch_number") is not None:
-                type_idx += 1
-                continue
-
-            # Extract mutation_type to match preparation phase
-            schema_info = type_data_raw.get("schema_info")
-            mutation_type = extract_mutation_type(schema_info)
-
-            # Build complete type_data with mutation_type (same as preparation phase)
-            type_data = build_type_data_complete(
-                type_name, type_data_raw, mutation_type
-            )
+    # Pack types into batches in type_guide order; each pass only revisits the
+    # types that didn't fit into an earlier batch
+    while pending_types:
+        still_pending: list[tuple[TypeDataComplete, int]] = []
 
-            # Calculate operations needed for this type
-            ops_needed = calculate_type_operations(type_data)
-
-            # Check if type can fit in empty batch (sanity check - warn if not in current batch)
-            if ops_needed > batch_capacity:
-                print(
-                    f"Warning: Type '{type_name}' requires {ops_needed} operations "
-                    + f"but batch capacity is only {batch_capacity} operations. "
-                    + "This type will be skipped. Increase max_subagents or ops_per_subagent in config."
-                )
-                type_guide[type_name]["batch_number"] = -1  # Mark as skipped
-                type_idx += 1
-                continue
+        for type_data, ops_needed in pending_types:
+            type_name = type_data["type_name"]
+            mutation_type = type_data.get("mutation_type")
 
             # Can this type fit in remaining batch capacity?
             # Calculate actual operations including query overhead for splits
@@ -327,68 +395,78 @@ def renumber_batches(
             if test_ops_remaining == 0:
                 can_fit = True
 
-            if can_fit:
-                # Yes, assign to current batch
-                type_guide[type_name]["batch_number"] = current_batch
-                packed_any_in_batch = True
-
-                # Advance position accounting for query overhead in splits
-                # This must match exactly how the simulation worked
-                ops_to_place = ops_needed
-                part_num = 0
-                while ops_to_place > 0:
-                    available = ops_per_subagent - current_ops_in_subagent
-
-                    # For components, part 2+ needs a query operation
-                    extra_ops = 0
-                    if part_num > 0 and mutation_type == "Component":
-                        extra_ops = 1
-
-                    ops_in_this_part = min(ops_to_place, available - extra_ops)
-                    current_ops_in_subagent += ops_in_this_part + extra_ops
-                    ops_to_place -= ops_in_this_part
-                    part_num += 1
-
-                    # If current subagent is full, move to next
-                    if current_ops_in_subagent >= ops_per_subagent:
-                        current_subagent_idx += 1
-                        current_ops_in_subagent = 0
-
-            # Move to next type (whether it fit or not)
-            type_idx += 1
-
-        # Done iterating through all types for this batch
-        # If we didn't pack anything, we're done entirely
-        if not packed_any_in_batch:
+            if not can_fit:
+                # Retry this type in the next batch
+                still_pending.append((type_data, ops_needed))
+                continue
+
+            # Yes, assign to current batch
+            type_guide[type_name]["batch_number"] = current_batch
+            any_changes = True
+            batches_index.setdefault(current_batch, []).append(type_data)
+
+            # Advance to where the simulation ended (it already accounted for the
+            # query overhead of every split part)
+            current_subagent_idx += test_subagent_idx
+            current_ops_in_subagent = test_ops_in_subagent
+
+        # Done with this batch
+        # If we didn't pack anything, nothing left can ever fit - we're done entirely
+        if len(still_pending) == len(pending_types):
             break
+        pending_types = still_pending
 
         # Start next batch
         current_batch += 1
         current_subagent_idx = 0
         current_ops_in_subagent = 0
 
-    # Report statistics
+    # Report statistics (single pass over the type guide)
     total = len(type_guide)
-    untested = len(
-        [t for t in type_guide.values() if t.get("test_status") == "untested"]
+    untested = 0
+    failed = 0
+    passed = 0
+    max_batch = 0
+    for type_data in type_guide.values():
+        test_status = type_data.get("test_status")
+        if test_status == "untested":
+            untested += 1
+        elif test_status == "failed":
+            failed += 1
+        elif test_status == "passed":
+            passed += 1
+        batch_num = type_data.get("batch_number") or 0
+        if batch_num > max_batch:
+            max_batch = batch_num
+
+    # Renumbering usually reproduces the numbering written by the previous run
+    changed = status_reset or any(
+        type_guide[type_name].get("batch_number") != batch_num
+        for type_name, batch_num in previous_batch_numbers.items()
     )
-    failed = len([t for t in type_guide.values() if t.get("test_status") == "failed"])
-    passed = len([t for t in type_guide.values() if t.get("test_status") == "passed"])
-    max_batch = max(
-        (t.get("batch_number") or 0 for t in type_guide.values()), default=0
+
+    statistics = BatchStatistics(
+        total=total,
+        passed=passed,
+        failed=failed,
+        untested=untested,
+        max_batch=max_batch,
+        changed=changed,
     )
 
-    print("✓ Batch renumbering complete!", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("Statistics:", file=sys.stderr)
-    print(f"  Total types: {total}", file=sys.stderr)
-    print(f"  Passed: {passed}", file=sys.stderr)
-    print(f"  Failed: {failed}", file=sys.stderr)
-    print(f"  Untested: {untested}", file=sys.stderr)
-    print(f"  Batches to process: {max_batch}", file=sys.stderr)
-    print("", file=sys.stderr)
+    # Nothing to report when no type was reset or renumbered (e.g. everything is done)
+    if any_changes:
+        print("✓ Batch renumbering complete!", file=sys.stderr)
+        print("", file=sys.stderr)
+        print("Statistics:", file=sys.stderr)
+        print(f"  Total types: {total}", file=sys.stderr)
+        print(f"  Passed: {passed}", file=sys.stderr)
+        print(f"  Failed: {failed}", file=sys.stderr)
+        print(f"  Untested: {untested}", file=sys.stderr)
+        print(f"  Batches to process: {max_batch}", file=sys.stderr)
+        print("", file=sys.stderr)
 
-    return data
+    return data, batches_index, statistics
 
 
 def extract_mutation_type(schema_info: dict[str, object] | None) -> str | None:
@@ -442,15 +520,49 @@ def build_type_data_complete(
     )
 
 
+@dataclass(frozen=True)
+class TypeDescription:
+    """Short type name and op count for one type (or part) in a subagent assignment."""
+
+    short_name: str
+    category: str
+    op_count: int
+    part_number: int | None = None
+    total_parts: int | None = None
+
+    def render(self, name_width: int = 0, op_count_width: int = 0) -> str:
+        """
+        Render the description, padding the type name and right-aligning the op count.
+
+        Uses .ljust() instead of f-string formatting to avoid issues with < in type names.
+
+        Args:
+            name_width: Width to pad the type name to
+            op_count_width: Width to right-align the operation count to
+
+        Returns:
+            String like "Time<Fixed> (R: 7 ops, 1 of 2)"
+        """
+        op_count = str(self.op_count).rjust(op_count_width)
+        if self.part_number is not None and self.total_parts is not None:
+            part_info = f", {self.part_number} of {self.total_parts}"
+        else:
+            part_info = ""
+        return f"{self.short_name.ljust(name_width)} ({self.category}: {op_count} ops{part_info})"
+
+    def __str__(self) -> str:
+        return self.render()
+
+
 def format_type_description(
     type_name: str,
     mutation_type: str | None,
     op_count: int,
     part_number: int | None = None,
     total_parts: int | None = None,
-) -> str:
+) -> TypeDescription:
     """
-    Format a type description for debug logging.
+    Build a type description for debug logging.
 
     Args:
         type_name: Fully-qualified type name
@@ -460,57 +572,59 @@ def format_type_description(
         total_parts: Optional total parts for multi-part types
 
     Returns:
-        Formatted description string like "TypeName (C: 10 ops)" or "TypeName (R: 5 ops, 2 of 3)"
+        Description that renders like "TypeName (C: 10 ops)" or "TypeName (R: 5 ops, 2 of 3)"
     """
     # Find the last :: that appears before any < to handle generic types correctly
     # For "bevy_time::time::Time<bevy_time::time::Real>", we want "Time<bevy_time::time::Real>"
-    if "<" in type_name:
-        # Find position of first <
-        generic_start = type_name.index("<")
-        # Find last :: before the <
-        prefix = type_name[:generic_start]
-        last_separator = prefix.rfind("::")
-        if last_separator != -1:
-            short_name = type_name[last_separator + 2 :]
-        else:
-            short_name = type_name
-    else:
-        short_name = type_name.split("::")[-1]
-
-    category = (
-        "C"
-        if mutation_type == "Component"
-        else "R"
-        if mutation_type == "Resource"
-        else "?"
-    )
+    generic_start = type_name.find("<")
+    name_end = generic_start if generic_start != -1 else len(type_name)
+    last_separator = type_name.rfind("::", 0, name_end)
+    short_name = type_name[last_separator + 2 :] if last_separator != -1 else type_name
 
-    if part_number is not None and total_parts is not None:
-        return (
-            f"{short_name} ({category}: {op_count} ops, {part_number} of {total_parts})"
-        )
-    return f"{short_name} ({category}: {op_count} ops)"
+    category = MUTATION_TYPE_CATEGORIES.get(mutation_type, "?")
+
+    return TypeDescription(short_name, category, op_count, part_number, total_parts)
 
 
 ENTITY_ID_PLACEHOLDER = 8589934670  # Placeholder entity ID used in spawn/resource examples
+ENTITY_ID_PLACEHOLDER_BYTES = str(ENTITY_ID_PLACEHOLDER).encode("ascii")
 
 
 def contains_entity_placeholder(value: Any) -> bool:  # pyright: ignore[reportExplicitAny]
     """
     Check if a value contains the entity ID placeholder anywhere in its structure.
 
-    Note: Uses Any type for recursive JSON traversal - unavoidable for arbitrary JSON structures.
+    Walks the structure with an explicit stack (no recursion) and stops at the first
+    match. Exact `type() is` checks are safe because parsed JSON only yields builtins.
+    When orjson is available, containers whose serialized form lacks the placeholder
+    digits are rejected without walking them at all.
+
+    Note: Uses Any type for JSON traversal - unavoidable for arbitrary JSON structures.
     """
-    if isinstance(value, int) and value == ENTITY_ID_PLACEHOLDER:
-        return True
-    elif isinstance(value, list):
-        for item in value:  # pyright: ignore[reportUnknownVariableType]
-            if contains_entity_placeholder(item):  # pyright: ignore[reportUnknownArgumentType]
-                return True
-    elif isinstance(value, dict):
-        for val in value.values():  # pyright: ignore[reportUnknownVariableType]
-            if contains_entity_placeholder(val):  # pyright: ignore[reportUnknownArgumentType]
+    value_type = type(value)  # pyright: ignore[reportAny]
+    if value_type is int:
+        return value == ENTITY_ID_PLACEHOLDER
+    if value_type is not dict and value_type is not list:
+        return False
+
+    if orjson is not None:
+        try:
+            if ENTITY_ID_PLACEHOLDER_BYTES not in orjson.dumps(value):  # pyright: ignore[reportAny]
+                return False
+        except orjson.JSONEncodeError:  # pyright: ignore[reportAny]
+            pass  # Not serializable by orjson - fall through to the walk
+
+    stack: list[Any] = [value]  # pyright: ignore[reportExplicitAny]
+    while stack:
+        current = stack.pop()  # pyright: ignore[reportAny]
+        current_type = type(current)  # pyright: ignore[reportAny]
+        if current_type is int:
+            if current == ENTITY_ID_PLACEHOLDER:
                 return True
+        elif current_type is dict:
+            stack.extend(current.values())  # pyright: ignore[reportAny]
+        elif current_type is list:
+            stack.extend(current)  # pyright: ignore[reportAny]
 
     return False
 
@@ -538,31 +652,104 @@ def extract_example_value(type_data: TypeDataComplete, mutation_type: str | None
     return None
 
 
-def generate_test_operations(type_data: TypeDataComplete) -> list[TestOperation]:
-    """Generate test operations for a single type."""
-    operations: list[TestOperation] = []
+def extract_path_fields(path_info: object) -> tuple[str, object, bool, object] | None:
+    """
+    Extract everything a mutation path contributes to its type's operations.
+
+    Args:
+        path_info: One entry of a type's mutation_paths
+
+    Returns:
+        None if the path is skipped (duplicate, not mutable or unavailable), otherwise
+        (path, root_example, has_test_value, test_value) where root_example is None
+        when no root example operation is needed and test_value may itself be None
+        (e.g. Option::None) when has_test_value is True
+    """
+    path_info_dict = cast(dict[str, object], path_info)
+
+    # Skip duplicate paths (marked during deduplication)
+    if "duplicate_of" in path_info_dict:
+        return None
+    path = cast(str, path_info_dict["path"])
+
+    # Note: path_info dict contains a "path_info" key that holds PathInfo
+    root_example: object = None
+    path_metadata = path_info_dict.get("path_info")
+    if path_metadata:
+        path_metadata_dict = cast(dict[str, object], path_metadata)
+
+        # Skip non-mutable paths
+        if path_metadata_dict.get("mutability") == "not_mutable":
+            return None
+
+        # Skip paths with unavailable root examples (unconstructible enum variants)
+        if "unavailable_reason" in path_metadata_dict:
+            return None
+
+        # Root example sets the enum variant for variant-dependent paths
+        root_example = path_metadata_dict.get("example")
+
+    # Get the first testable example (one operation per mutation path)
+    examples = path_info_dict.get("examples")
+    if examples:
+        # For enum variants: find first testable example
+        for candidate in cast(list[object], examples):
+            if isinstance(candidate, dict):
+                candidate_dict = cast(dict[str, object], candidate)
+                if "example" in candidate_dict:
+                    # Found a testable variant (value may be None for Option::None)
+                    return path, root_example, True, candidate_dict["example"]
+        return path, root_example, False, None
+    if "example" in path_info_dict:
+        return path, root_example, True, path_info_dict["example"]
+    return path, root_example, False, None
+
+
+def generate_test_operations(
+    type_data: TypeDataComplete,
+) -> tuple[list[TestOperation], OperationIndices]:
+    """
+    Generate test operations for a single type.
+
+    calculate_type_operations counts these without building them - keep the two in sync.
+    Every operation gets operation_id 0 as a placeholder (keeping it the first key):
+    distribution renumbers each operation when it is assigned to a subagent.
+
+    Returns:
+        Tuple of (operations, indices) where indices locates the spawn/insert, query
+        and first mutation operations, recorded as they are generated
+    """
     type_name = type_data["type_name"]
+    operations: list[TestOperation] = []
     mutation_type = type_data.get("mutation_type")
     mutation_paths = type_data.get("mutation_paths") or []
 
+    # Mutations target the queried entity for components, the resource otherwise.
+    # Each mutation copies this template and fills in its path and value.
+    is_component = mutation_type == "Component"
+    mutation_template: TestOperation = (
+        {
+            "operation_id": 0,
+            "tool": MUTATE_COMPONENTS_TOOL,
+            "entity": "USE_QUERY_RESULT",
+            "component": type_name,
+        }
+        if is_component
+        else {"operation_id": 0, "tool": MUTATE_RESOURCES_TOOL, "resource": type_name}
+    )
+
     # Extract example value based on mutation_type
     example_value = extract_example_value(type_data, mutation_type)
 
     # Step 1: Spawn or Insert (if example exists)
     if example_value is not None:
-        if mutation_type == "Component":
+        if is_component:
             # Spawn entity with component
-            op = cast(
-                TestOperation,
-                cast(
-                    object,
-                    {
-                        "operation_id": len(operations),
-                        "tool": "mcp__brp__world_spawn_entity",
-                        "components": {type_name: example_value},
-                    },
-                ),
-            )
+            op: TestOperation = {
+                "operation_id": 0,
+                "tool": SPAWN_ENTITY_TOOL,
+                "components": {type_name: example_value},
+            }
 
             # Check for entity ID placeholders
             if contains_entity_placeholder(example_value):
@@ -571,18 +758,12 @@ def generate_test_operations(type_data: TypeDataComplete) -> list[TestOperation]
             operations.append(op)
         elif mutation_type == "Resource":
             # Insert resource
-            op = cast(
-                TestOperation,
-                cast(
-                    object,
-                    {
-                        "operation_id": len(operations),
-                        "tool": "mcp__brp__world_insert_resources",
-                        "resource": type_name,
-                        "value": example_value,
-                    },
-                ),
-            )
+            op = {
+                "operation_id": 0,
+                "tool": INSERT_RESOURCES_TOOL,
+                "resource": type_name,
+                "value": example_value,
+            }
 
             # Check for entity ID placeholders
             if contains_entity_placeholder(example_value):
@@ -590,167 +771,161 @@ def generate_test_operations(type_data: TypeDataComplete) -> list[TestOperation]
 
             operations.append(op)
 
+    spawn_idx = 0 if operations else None
+
     # Step 2: Query (components only)
-    if mutation_type == "Component":
+    query_idx: int | None = None
+    if is_component:
+        query_idx = len(operations)
         operations.append(
-            cast(
-                TestOperation,
-                cast(
-                    object,
-                    {
-                        "operation_id": len(operations),
-                        "tool": "mcp__brp__world_query",
-                        "filter": {"with": [type_name]},
-                        "data": {},
-                        "entity": "USE_QUERY_RESULT",
-                    },
-                ),
-            )
+            {
+                "operation_id": 0,
+                "tool": QUERY_TOOL,
+                "filter": {"with": [type_name]},
+                "data": {},
+                "entity": "USE_QUERY_RESULT",
+            }
         )
 
-    # Step 3: Mutations
-    for path_info in mutation_paths:
-        # Extract path from the path_info value (path_info is already object type)
-        path_info_dict = cast(dict[str, object], path_info)
-        path = cast(str, path_info_dict["path"])
-
-        # Skip duplicate paths (marked during deduplication)
-        if "duplicate_of" in path_info_dict:
-            continue
-
-        # Skip non-mutable paths
-        # Note: path_info dict contains a "path_info" key that holds PathInfo
-        path_metadata = path_info_dict.get("path_info")
-        if path_metadata:
-            path_metadata_dict = cast(dict[str, object], path_metadata)
-            if path_metadata_dict.get("mutability") == "not_mutable":
-                continue
-
-            # Skip paths with unavailable root examples (unconstructible enum variants)
-            if "unavailable_reason" in path_metadata_dict:
-                continue
+    # Step 3: Mutations (skipped paths are filtered out before the loop body)
+    mutation_start = len(operations)
+    mutable_paths = (
+        fields for fields in map(extract_path_fields, mutation_paths) if fields
+    )
+    for path, root_example, has_test_value, test_value in mutable_paths:
+        # Always emit root example if present - no optimization
+        if root_example is not None:
+            # Emit root example operation to set enum variant
+            root_op = mutation_template.copy()
+            root_op["path"] = ""
+            root_op["value"] = root_example
+            root_op["is_root_example"] = True
 
-            # Check for root example requirement (variant-dependent paths)
-            # Always emit root example if present - no optimization
-            root_example = path_metadata_dict.get("example")
-            if root_example is not None:
-                # Emit root example operation to set enum variant
-                if mutation_type == "Component":
-                    root_op = cast(
-                        TestOperation,
-                        cast(
-                            object,
-                            {
-                                "operation_id": len(operations),
-                                "tool": "mcp__brp__world_mutate_components",
-                                "entity": "USE_QUERY_RESULT",
-                                "component": type_name,
-                                "path": "",
-                                "value": root_example,
-                                "is_root_example": True,
-                            },
-                        ),
-                    )
-                else:  # Resource
-                    root_op = cast(
-                        TestOperation,
-                        cast(
-                            object,
-                            {
-                                "operation_id": len(operations),
-                                "tool": "mcp__brp__world_mutate_resources",
-                                "resource": type_name,
-                                "path": "",
-                                "value": root_example,
-                                "is_root_example": True,
-                            },
-                        ),
-                    )
+            # Check for entity ID placeholders in root example
+            if contains_entity_placeholder(root_example):
+                root_op["entity_id_substitution"] = ENTITY_ID_PLACEHOLDER
 
-                # Check for entity ID placeholders in root example
-                if contains_entity_placeholder(root_example):
-                    root_op["entity_id_substitution"] = ENTITY_ID_PLACEHOLDER
-
-                operations.append(root_op)
-
-        # Get test value for this mutation path (path_info is already object type)
-        path_info_dict = cast(dict[str, object], path_info)
-        example = path_info_dict.get("example")
-        examples = path_info_dict.get("examples")
-
-        # Get the first testable example (one operation per mutation path)
-        test_value: object | None = None
-        found_example = False
-        if examples:
-            # For enum variants: find first testable example
-            examples_list = cast(list[object], examples)
-            for candidate in examples_list:
-                if isinstance(candidate, dict):
-                    candidate_dict = cast(dict[str, object], candidate)
-                    if "example" in candidate_dict:
-                        # Found a testable variant (value may be None for Option::None)
-                        test_value = candidate_dict["example"]
-                        found_example = True
-                        break
-        elif "example" in path_info_dict:
-            test_value = example
-            found_example = True
+            operations.append(root_op)
 
         # Skip if no testable example found
-        if not found_example:
+        if not has_test_value:
             continue
 
-        if mutation_type == "Component":
-            op = cast(
-                TestOperation,
-                cast(
-                    object,
-                    {
-                        "operation_id": len(operations),
-                        "tool": "mcp__brp__world_mutate_components",
-                        "entity": "USE_QUERY_RESULT",
-                        "component": type_name,
-                        "path": path,
-                        "value": test_value,
-                    },
-                ),
-            )
-        else:  # Resource
-            op = cast(
-                TestOperation,
-                cast(
-                    object,
-                    {
-                        "operation_id": len(operations),
-                        "tool": "mcp__brp__world_mutate_resources",
-                        "resource": type_name,
-                        "path": path,
-                        "value": test_value,
-                    },
-                ),
-            )
+        op = mutation_template.copy()
+        op["path"] = path
+        op["value"] = test_value
 
         if contains_entity_placeholder(test_value):
             op["entity_id_substitution"] = ENTITY_ID_PLACEHOLDER
 
         operations.append(op)
 
-    return operations
+    indices = OperationIndices(
+        spawn_idx=spawn_idx,
+        query_idx=query_idx,
+        mutation_start_idx=mutation_start if len(operations) > mutation_start else None,
+    )
+    return operations, indices
 
 
 def calculate_type_operations(type_data: TypeDataComplete) -> int:
     """
     Calculate how many operations a type will generate.
 
+    Counts with the same rules as generate_test_operations but builds no operations,
+    since batch packing sizes every untested type and only the current batch's types
+    are ever generated.
+
     Args:
         type_data: The type to evaluate
 
     Returns:
         Number of operations this type will generate
     """
-    # Generate operations to count them (using placeholder port)
-    all_operations = generate_test_operations(type_data)
-    return len(all_operations)
+    mutation_type = type_data.get("mutation_type")
+    op_count = 0
+
+    # Spawn or insert (if example exists)
+    if extract_example_value(type_data, mutation_type) is not None:
+        op_count += 1
+
+    # Query (components only)
+    if mutation_type == "Component":
+        op_count += 1
+
+    # Mutations, plus a root example operation ahead of variant-dependent paths
+    mutation_paths = type_data.get("mutation_paths") or []
+    mutable_paths = (
+        fields for fields in map(extract_path_fields, mutation_paths) if fields
+    )
+    for _, root_example, has_test_value, _ in mutable_paths:
+        if root_example is not None:
+            op_count += 1
+        if has_test_value:
+            op_count += 1
+
+    return op_count
+
+
+def build_type_with_ops(type_data: TypeDataComplete) -> TypeWithOps:
+    """
+    Generate all operations for one batch type.
+
+    Independent per type, so callers can map it over a batch in any order.
+
+    Args:
+        type_data: Complete type data with mutation_type, as built by renumber_batches
+
+    Returns:
+        TypeWithOps with the complete type data, its operations, their indices
+        and their count
+    """
+    # Generate all operations for this type
+    # Ports are not part of generation - they are assigned during distribution
+    all_operations, operation_indices = generate_test_operations(type_data)
+
+    # Use actual operation count from generated operations
+    return TypeWithOps(
+        type_data=type_data,
+        all_operations=all_operations,
+        operation_indices=operation_indices,
+        ops_needed=len(all_operations),
+    )
+
+
+def build_type_test(
+    type_name: str,
+    mutation_type: str | None,
+    operations: list[TestOperation],
+    part_number: int | None = None,
+    total_parts: int | None = None,
+) -> TypeTest:
+    """
+    Build the test plan entry for one type (or one part of a split type).
+
+    Args:
+        type_name: Fully-qualified type name
+        mutation_type: "Component", "Resource", or None
+        operations: Operations for this type/part, already numbered and assigned a port
+        part_number: Optional part number for multi-part types (1-indexed)
+        total_parts: Optional total parts for multi-part types
+
+    Returns:
+        TypeTest with part fields only when the type is split
+    """
+    if part_number is not None and total_parts is not None:
+        return {
+            "type_name": type_name,
+            "mutation_type": mutation_type or "Unknown",
+            "part_number": part_number,
+            "total_parts": total_parts,
+            "operations": operations,
+        }
+    return {
+        "type_name": type_name,
+        "mutation_type": mutation_type or "Unknown",
+        "operations": operations,
+    }
 
 
 def _find_operation_indices(all_operations: list[TestOperation]) -> OperationIndices:
@@ -769,14 +944,11 @@ def _find_operation_indices(all_operations: list[TestOperation]) -> OperationInd
 
     for idx, op in enumerate(all_operations):
         tool = op.get("tool", "")
-        if tool in ["mcp__brp__world_spawn_entity", "mcp__brp__world_insert_resources"]:
+        if tool in SPAWN_TOOLS:
             spawn_idx = idx
-        elif tool == "mcp__brp__world_query":
+        elif tool == QUERY_TOOL:
             query_idx = idx
-        elif tool in [
-            "mcp__brp__world_mutate_components",
-            "mcp__brp__world_mutate_resources",
-        ]:
+        elif tool in MUTATE_TOOLS:
             if mutation_start_idx is None:
                 mutation_start_idx = idx
 
@@ -785,42 +957,20 @@ def _find_operation_indices(all_operations: list[TestOperation]) -> OperationInd
     )
 
 
-def find_split_points(mutations: list[TestOperation], num_parts: int) -> list[int]:
-    """
-    Find split points that divide mutations into roughly equal parts.
-    Simple division with no root mutation backtracking - prepending handles correctness.
-
-    Args:
-        mutations: List of mutation operations to split
-        num_parts: Number of parts to split into
-
-    Returns:
-        List of split indices (length = num_parts - 1)
-        For 4 parts, returns 3 indices indicating where to split
-    """
-    if num_parts == 1:
-        return []
-
-    mutation_count = len(mutations)
-    mutations_per_part = mutation_count / num_parts
-
-    split_indices: list[int] = []
-    for part_num in range(1, num_parts):
-        split_idx = int(part_num * mutations_per_part)
-        split_indices.append(split_idx)
-
-    return split_indices
-
-
 def finalize_subagent(
     current_subagent_num: int,
     current_subagent_tests: list[TypeTest],
-    current_subagent_descriptions: list[str],
+    current_subagent_descriptions: list[TypeDescription],
     batch_num: int,
     assignments: list[SubagentAssignment],
+    assignment_descriptions: list[list[TypeDescription]],
+    assigned_type_names: set[str],
+    test_plans: list[TestPlan],
 ) -> None:
     """
-    Finalize a subagent by writing its test plan to file and creating an assignment.
+    Finalize a subagent by collecting its test plan and creating an assignment.
+
+    The plan is written later by write_test_plans, together with the other plans.
 
     Args:
         current_subagent_num: The subagent number (1-indexed)
@@ -828,6 +978,9 @@ def finalize_subagent(
         current_subagent_descriptions: List of type descriptions for this subagent
         batch_num: The current batch number
         assignments: List to append the new assignment to (modified in place)
+        assignment_descriptions: List to append the structured descriptions to (modified in place)
+        assigned_type_names: Set of type names written to test plans (modified in place)
+        test_plans: List to append the new test plan to (modified in place)
     """
     if not current_subagent_tests:
         return  # Nothing to finalize
@@ -842,38 +995,61 @@ def finalize_subagent(
         "test_plan_file": test_plan_file,
         "tests": current_subagent_tests,
     }
+    test_plans.append(test_plan)
+
+    type_descriptions = [
+        str(description) for description in current_subagent_descriptions
+    ]
+    types_str = ", ".join(type_descriptions)
+    assignment: SubagentAssignment = {
+        "subagent": current_subagent_num,
+        "port": port,
+        "window_description": f"Subagent {current_subagent_num}: {types_str}",
+        "task_description": f"{port} {types_str}",
+        "test_plan_file": test_plan_file,
+        "type_descriptions": type_descriptions,
+    }
+    assignments.append(assignment)
+    assignment_descriptions.append(current_subagent_descriptions)
+    assigned_type_names.update(
+        test["type_name"] for test in current_subagent_tests if "type_name" in test
+    )
+
+
+def write_test_plans(test_plans: list[TestPlan]) -> None:
+    """
+    Write all finalized test plans to their files.
+
+    The plans are independent, so the writes are overlapped on a small thread pool.
+    The first I/O error is reported on the main thread and exits.
+
+    Args:
+        test_plans: Test plans collected by finalize_subagent
+    """
+
+    def write_test_plan(test_plan: TestPlan) -> None:
+        with open(test_plan["test_plan_file"], "wb") as f:
+            # Compact: plans are only read by scripts (operation_manager.py re-indents on update)
+            _ = f.write(dump_json_bytes(test_plan, indent=False))
+
+    if not test_plans:
+        return
 
     try:
-        with open(test_plan_file, "w", encoding="utf-8") as f:
-            json.dump(test_plan, f, indent=2)
+        with ThreadPoolExecutor(max_workers=min(8, len(test_plans))) as executor:
+            _ = list(executor.map(write_test_plan, test_plans))
     except IOError as e:
         print(f"Error writing test plan file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    types_str = ", ".join(current_subagent_descriptions)
-    assignment: SubagentAssignment = cast(
-        SubagentAssignment,
-        cast(
-            object,
-            {
-                "subagent": current_subagent_num,
-                "port": port,
-                "window_description": f"Subagent {current_subagent_num}: {types_str}",
-                "task_description": f"{port} {types_str}",
-                "test_plan_file": test_plan_file,
-                "type_descriptions": current_subagent_descriptions,
-            },
-        ),
-    )
-    assignments.append(assignment)
-
 
-def split_operations_for_part_new(
+def split_operations_for_part(
     all_operations: list[TestOperation],
     part_number: int,
     total_parts: int,
     slots_per_subagent: int,
     accumulated_slots: int = 0,
+    indices: OperationIndices | None = None,
 ) -> list[TestOperation]:
     """
     Split operations for subagent-boundary splitting with GREEDY filling.
@@ -891,12 +1067,14 @@ def split_operations_for_part_new(
         total_parts: Total number of parts
         slots_per_subagent: How many slots THIS part gets (greedy allocation)
         accumulated_slots: How many slots have been used by previous parts
+        indices: Precomputed operation indices (found by scanning if omitted)
     """
     if total_parts == 1:
         return all_operations
 
-    # Find operation indices
-    indices = _find_operation_indices(all_operations)
+    # Find operation indices unless the caller already has them
+    if indices is None:
+        indices = _find_operation_indices(all_operations)
     spawn_idx = indices["spawn_idx"]
     query_idx = indices["query_idx"]
     mutation_start_idx = indices["mutation_start_idx"]
@@ -995,92 +1173,10 @@ def split_operations_for_part_new(
     return result
 
 
-def split_operations_for_part(
-    all_operations: list[TestOperation], part_number: int, total_parts: int
-) -> list[TestOperation]:
-    """
-    Split operations for multi-part type testing with variable part counts.
-
-    Part 1: spawn/insert + query + first chunk of mutations
-    Part 2+: query + root_mutation (if needed) + chunk of mutations (no spawn)
-
-    Root mutations (path="") are prepended to parts that start with deep paths
-    to establish correct variant structure.
-    """
-    if total_parts == 1:
-        return all_operations
-
-    # Find operation indices
-    indices = _find_operation_indices(all_operations)
-    spawn_idx = indices["spawn_idx"]
-    query_idx = indices["query_idx"]
-    mutation_start_idx = indices["mutation_start_idx"]
-
-    # Get all mutation operations
-    mutations: list[TestOperation] = []
-    if mutation_start_idx is not None:
-        mutations = all_operations[mutation_start_idx:]
-
-    # Find all split points using simple fixed-size division
-    split_indices = find_split_points(mutations, total_parts)
-
-    if part_number == 1:
-        # Part 1: spawn + query + first chunk of mutations
-        result: list[TestOperation] = []
-
-        # Add spawn if it exists
-        if spawn_idx is not None:
-            result.append(all_operations[spawn_idx])
-
-        # Add query for components
-        if query_idx is not None:
-            result.append(all_operations[query_idx])
-
-        # Add mutations up to first split
-        if split_indices:
-            result.extend(mutations[: split_indices[0]])
-        else:
-            result.extend(mutations)
-
-        return result
-    else:
-        # Part 2+: query + possibly prepended root + chunk of mutations
-        result = []
-
-        # Add query for components
-        if query_idx is not None:
-            result.append(all_operations[query_idx])
-
-        # Determine mutation range for this part
-        start_idx = split_indices[part_number - 2]  # Previous split point
-        end_idx = (
-            split_indices[part_number - 1]
-            if part_number < total_parts
-            else len(mutations)
-        )
-
-        # Check if we need to prepend a root mutation
-        if start_idx < len(mutations):
-            first_op = mutations[start_idx]
-            first_path = first_op.get("path", "")
-
-            # If first operation is NOT a root mutation, find most recent root
-            if first_path != "":
-                for i in range(start_idx - 1, -1, -1):
-                    if mutations[i].get("path") == "":
-                        result.append(mutations[i])  # Duplicate the root mutation
-                        break
-
-        # Add this part's mutation chunk
-        result.extend(mutations[start_idx:end_idx])
-
-        return result
-
-
 # Load and parse JSON file
 try:
-    with open(json_file, "r") as f:
-        data = cast(AllTypesData, json.load(f))
+    with open(json_file, "rb") as f:
+        data = cast(AllTypesData, load_json_bytes(f.read()))
 except json.JSONDecodeError as e:
     print(f"Error parsing JSON: {e}", file=sys.stderr)
     sys.exit(1)
@@ -1090,31 +1186,16 @@ if "type_guide" not in data:
     print("Error: Expected dict with 'type_guide' at root", file=sys.stderr)
     sys.exit(1)
 
-# Always call initialize (it exits early if already initialized)
-result = subprocess.run(
-    [
-        "python3",
-        ".claude/scripts/mutation_test/initialize_test_metadata.py",
-        "--file",
-        json_file,
-    ],
-    capture_output=True,
-    text=True,
-)
-if result.returncode != 0:
-    print(f"Error initializing test metadata: {result.stderr}", file=sys.stderr)
+# Always initialize in-process (skipped if already initialized); data is updated in place
+if not data["type_guide"]:
+    print(
+        "Error initializing test metadata: No type_guide found in file", file=sys.stderr
+    )
     sys.exit(1)
-
-# Print initialization output (will be "Already initialized" or initialization details)
-if result.stderr:
-    print(result.stderr, file=sys.stderr, end="")
-
-# Reload the file (may have been modified by initialization)
-try:
-    with open(json_file, "r") as f:
-        data = cast(AllTypesData, json.load(f))
-except json.JSONDecodeError as e:
-    print(f"Error parsing JSON after initialization: {e}", file=sys.stderr)
+if is_already_initialized(data):
+    print("✓ Already initialized (skipping)", file=sys.stderr)
+elif not initialize_all_types(data, Path(json_file)):
+    print("Error initializing test metadata", file=sys.stderr)
     sys.exit(1)
 
 type_guide = data["type_guide"]
@@ -1124,8 +1205,8 @@ excluded_type_names: set[str] = set()
 excluded_types_file = Path(".claude/config/mutation_test_excluded_types.json")
 if excluded_types_file.exists():
     try:
-        with open(excluded_types_file, "r") as f:
-            excluded_config_raw = json.load(f)  # pyright: ignore[reportAny]
+        with open(excluded_types_file, "rb") as f:
+            excluded_config_raw = load_json_bytes(f.read())
             excluded_config = cast(ExcludedTypesConfig, excluded_config_raw)
             excluded_type_names = {
                 entry["type_name"] for entry in excluded_config["excluded_types"]
@@ -1142,20 +1223,25 @@ if excluded_types_file.exists():
 # Deduplication and validation now handled by initialize_test_metadata.py
 
 # Renumber batches before every batch (resets failed→untested, reassigns batch numbers)
-data = renumber_batches(
+data, batches_index, batch_statistics = renumber_batches(
     data, batch_capacity, max_subagents, ops_per_subagent, excluded_type_names
 )
 
-# Write updated data back to file
-try:
-    with open(json_file, "w") as f:
-        json.dump(data, f, indent=2)
-except IOError as e:
-    print(f"Error writing updated JSON: {e}", file=sys.stderr)
-    sys.exit(1)
-
 # NOW discover current batch number using the renumbered data
 batch_result: int | str = find_current_batch(data)
+
+# Write updated data back to file via a temp file so a failed write can't corrupt it
+# (skipped when renumbering reproduced exactly what is already on disk)
+if batch_statistics["changed"]:
+    try:
+        json_tmp_file = f"{json_file}.tmp"
+        with open(json_tmp_file, "wb") as f:
+            _ = f.write(dump_json_bytes(data))
+        os.replace(json_tmp_file, json_file)
+    except IOError as e:
+        print(f"Error writing updated JSON: {e}", file=sys.stderr)
+        sys.exit(1)
+
 if batch_result == "COMPLETE":
     print("All tests complete! No untested batches remaining.", file=sys.stderr)
     sys.exit(0)
@@ -1166,19 +1252,10 @@ batch_num = batch_result
 
 type_guide: dict[str, TypeDataComplete] = data["type_guide"]
 
-# Get types for the specified batch
-batch_types: list[TypeDataComplete] = []
-for type_name, type_info in type_guide.items():
-    # Skip excluded types
-    if type_name in excluded_type_names:
-        continue
-
-    if type_info.get("batch_number") == batch_num:
-        # Add type_name to the dict for consistency
-        type_item: TypeDataComplete = cast(
-            TypeDataComplete, cast(object, {"type_name": type_name, **type_info})
-        )
-        batch_types.append(type_item)
+# Get types for the specified batch from the index built while renumbering - these
+# are the complete type data (with mutation_type) built when the types were sized
+# (excluded types are never packed, so they are not in the index)
+batch_types: list[TypeDataComplete] = batches_index.get(batch_num, [])
 
 if not batch_types:
     print(f"No types found for batch {batch_num}", file=sys.stderr)
@@ -1187,38 +1264,9 @@ if not batch_types:
 
 # Build complete type data with operations for distribution
 # New approach: Track subagent boundaries for splitting
-class TypeWithOps(TypedDict):
-    type_data: TypeDataComplete
-    all_operations: list[TestOperation]
-    ops_needed: int
-
-
-types_with_ops: list[TypeWithOps] = []
-
-for type_item in batch_types:
-    # Extract mutation_type from schema_info
-    schema_info = type_item.get("schema_info")
-    mutation_type = extract_mutation_type(schema_info)
-
-    # Build complete type_data with mutation_type
-    type_data = build_type_data_complete(
-        type_item["type_name"], type_item, mutation_type
-    )
-
-    # Generate all operations for this type
-    # Use a placeholder port - will be assigned later
-    all_operations = generate_test_operations(type_data)
-
-    # Use actual operation count from generated operations
-    ops_needed = len(all_operations)
-
-    types_with_ops.append(
-        TypeWithOps(
-            type_data=type_data,
-            all_operations=all_operations,
-            ops_needed=ops_needed,
-        )
-    )
+types_with_ops: list[TypeWithOps] = [
+    build_type_with_ops(type_data) for type_data in batch_types
+]
 
 # BACKUP OLD TEST FILES BEFORE CREATING NEW ONES
 DEBUG_LOG = get_mutation_test_log(mutation_config)
@@ -1235,19 +1283,22 @@ if os.path.exists(DEBUG_LOG):
         backup_log_file = f"{backup_folder}/mutation_test.log"
         os.rename(DEBUG_LOG, backup_log_file)
 
-        # Move all mutation_test_*.json files
-        test_plan_pattern = f"{log_dir}/mutation_test_*.json"
-        test_plan_files = glob.glob(test_plan_pattern)
+        # Move all mutation_test_*.json files (single scandir pass, no glob matching)
         files_moved = 1  # Count the log file
 
-        for test_plan_file in test_plan_files:
-            filename = os.path.basename(test_plan_file)
-            backup_test_file = f"{backup_folder}/{filename}"
-            try:
-                os.rename(test_plan_file, backup_test_file)
-                files_moved += 1
-            except OSError:
-                pass  # Continue if individual file move fails
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (
+                    filename.startswith("mutation_test_") and filename.endswith(".json")
+                ):
+                    continue
+                backup_test_file = f"{backup_folder}/{filename}"
+                try:
+                    os.rename(entry.path, backup_test_file)
+                    files_moved += 1
+                except OSError:
+                    pass  # Continue if individual file move fails
 
         print(
             f"Backed up {files_moved} test file(s) to: {backup_folder}",
@@ -1259,10 +1310,13 @@ if os.path.exists(DEBUG_LOG):
 # Distribute types across subagents with boundary-only splitting
 # Track which subagent we're on and how many operations are filled
 assignments: list[SubagentAssignment] = []
+assignment_descriptions: list[list[TypeDescription]] = []  # Parallel to assignments
+assigned_type_names: set[str] = set()  # Unique types written to test plans
+test_plans: list[TestPlan] = []  # Written together once distribution is done
 current_subagent_num = 1
 current_subagent_ops_used = 0
 current_subagent_tests: list[TypeTest] = []
-current_subagent_descriptions: list[str] = []
+current_subagent_descriptions: list[TypeDescription] = []
 operation_id_counter = OPERATION_ID_START
 
 for type_with_ops in types_with_ops:
@@ -1298,22 +1352,20 @@ for type_with_ops in types_with_ops:
     # Handle non-split case (type fits entirely in current subagent)
     if not needs_splitting:
         # Fits entirely in current subagent (no split needed)
-        operations = deepcopy(all_operations)
+        # Shallow per-operation copies: only top-level fields are rewritten below
+        operations = [op.copy() for op in all_operations]
 
         # Renumber operation IDs
         port = calculate_port(current_subagent_num, mutation_config)
-        for op in operations:
-            op["operation_id"] = operation_id_counter
+        for op_id, op in enumerate(operations, start=operation_id_counter):
+            op["operation_id"] = op_id
             op["port"] = port
-            operation_id_counter += 1
+        operation_id_counter += len(operations)
 
         # Add to current subagent
-        test: TypeTest = {
-            "type_name": type_name,
-            "mutation_type": mutation_type or "Unknown",
-            "operations": operations,
-        }
-        current_subagent_tests.append(test)
+        current_subagent_tests.append(
+            build_type_test(type_name, mutation_type, operations)
+        )
 
         # Format description
         description = format_type_description(type_name, mutation_type, len(operations))
@@ -1331,6 +1383,9 @@ for type_with_ops in types_with_ops:
                 current_subagent_descriptions,
                 batch_num,
                 assignments,
+                assignment_descriptions,
+                assigned_type_names,
+                test_plans,
             )
 
             # Clear the current subagent data immediately after finalizing
@@ -1437,40 +1492,32 @@ for type_with_ops in types_with_ops:
             # Check if we have slots available for this part
             if slots_for_this_part > 0 and remaining_ops > 0:
                 # Get operations for this part (pass slots available, not ops consumed)
-                operations = split_operations_for_part_new(
+                operations = split_operations_for_part(
                     all_operations,
                     part_number,
                     total_parts,
                     slots_for_this_part,  # How many slots available in this subagent
                     accumulated_ops_so_far,  # How many operations previous parts used
+                    type_with_ops["operation_indices"],
                 )
-                operations = deepcopy(operations)
+                operations = [op.copy() for op in operations]
 
                 # Use ACTUAL operation count (accounts for pair-preservation overage)
                 actual_ops_in_this_part = len(operations)
 
                 # Renumber operation IDs
                 port = calculate_port(current_subagent_num, mutation_config)
-                for op in operations:
-                    op["operation_id"] = operation_id_counter
+                for op_id, op in enumerate(operations, start=operation_id_counter):
+                    op["operation_id"] = op_id
                     op["port"] = port
-                    operation_id_counter += 1
+                operation_id_counter += len(operations)
 
                 # Add to current subagent
-                test = cast(
-                    TypeTest,
-                    cast(
-                        object,
-                        {
-                            "type_name": type_name,
-                            "mutation_type": mutation_type or "Unknown",
-                            "part_number": part_number,
-                            "total_parts": total_parts,
-                            "operations": operations,
-                        },
-                    ),
+                current_subagent_tests.append(
+                    build_type_test(
+                        type_name, mutation_type, operations, part_number, total_parts
+                    )
                 )
-                current_subagent_tests.append(test)
 
                 # Format description
                 description = format_type_description(
@@ -1496,6 +1543,9 @@ for type_with_ops in types_with_ops:
                     current_subagent_descriptions,
                     batch_num,
                     assignments,
+                    assignment_descriptions,
+                    assigned_type_names,
+                    test_plans,
                 )
 
                 # Clear the current subagent data immediately after finalizing
@@ -1525,217 +1575,140 @@ if current_subagent_tests:
         current_subagent_descriptions,
         batch_num,
         assignments,
+        assignment_descriptions,
+        assigned_type_names,
+        test_plans,
     )
 
-# Calculate unique types that made it into assignments (for debug log and progress)
-debug_assigned_type_names: set[str] = set()
-for assignment in assignments:
-    try:
-        with open(assignment["test_plan_file"], "r") as f:
-            test_plan_raw = json.load(f)  # pyright: ignore[reportAny]
-            test_plan = cast(TestPlan, test_plan_raw)
-            for test in test_plan.get("tests", []):
-                type_name = test.get("type_name")
-                if type_name:
-                    debug_assigned_type_names.add(type_name)
-    except (IOError, json.JSONDecodeError):
-        pass
-
-unique_types_count = len(debug_assigned_type_names)
-
-# Calculate types remaining after this batch
-untested_count = len(
-    [t for t in type_guide.values() if t.get("test_status") == "untested"]
-)
-remaining_types = untested_count - unique_types_count
+# Write all test plan files
+write_test_plans(test_plans)
+
+# Unique types that made it into assignments (for debug log and progress)
+unique_types_count = len(assigned_type_names)
+
+# Batch count and types remaining after this batch (statuses are unchanged since renumbering)
+total_batches = batch_statistics["max_batch"]
+remaining_types = batch_statistics["untested"] - unique_types_count
 
 # Create new debug log with metadata for current batch
-ports = [a["port"] for a in assignments]
-if len(ports) > 0:
-    min_port = min(ports)
-    max_port = max(ports)
-    ports_str = f"{min_port} - {max_port} ({len(ports)} ports)"
+# Assignments are created in subagent order, so their ports are ascending
+if assignments:
+    min_port = assignments[0]["port"]
+    max_port = assignments[-1]["port"]
+    ports_str = f"{min_port} - {max_port} ({len(assignments)} ports)"
 else:
     ports_str = "none"
 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-with open(DEBUG_LOG, "w", encoding="utf-8") as f:
-    _ = f.write("# Mutation Test Debug Log\n")
-    _ = f.write(f"# Started: {timestamp}\n")
-    _ = f.write(f"# Batch Number:             {batch_num:>2}\n")
-    ops_per_batch = max_subagents * ops_per_subagent
-    _ = f.write(f"# Max subagents:            {max_subagents:>2}\n")
-    _ = f.write(f"# Ops per Subagent:         {ops_per_subagent:>2}\n")
-    _ = f.write(f"# Ops per Batch:           {ops_per_batch:>3}\n")
-    _ = f.write(f"# Types remaining:         {remaining_types:>3}\n")
-    _ = f.write(f"# Ports: {ports_str}\n")
-
-    # Calculate total ops for each assignment and find max width for alignment
-    assignment_ops: list[int] = []
-    for assignment in assignments:
-        total_ops = 0
-        try:
-            with open(assignment["test_plan_file"], "r") as plan_f:
-                plan_data = json.load(plan_f)  # pyright: ignore[reportAny]
-                plan = cast(TestPlan, plan_data)
-                for test in plan.get("tests", []):
-                    total_ops += len(test.get("operations", []))
-        except (IOError, json.JSONDecodeError):
-            pass
-        assignment_ops.append(total_ops)
-
-    # Find max width for right alignment
-    max_ops_width = (
-        max(len(str(ops)) for ops in assignment_ops) if assignment_ops else 1
-    )
-    max_subagent_width = len(str(len(assignments)))
-
-    # Calculate indentation for multi-line type lists
-    # Format: "# {subagent_num} ({total_ops} ops) "
-    # Total prefix length includes: "# " (2) + num + " (" (2) + ops + " ops) " (6)
-    prefix_length = 2 + max_subagent_width + 2 + max_ops_width + 6
-    # For continuation lines, we need prefix_length - 1 spaces after the "#"
-    continuation_indent = prefix_length - 1
-
-    # Find longest type name across ALL assignments for global columnar alignment
-    # Also find max operation count for right-aligning op counts
-    max_type_name_length = 0
-    max_op_count_per_type = 0
-    for assignment in assignments:
-        for type_desc in assignment["type_descriptions"]:
-            # Split on first opening paren to get type name
-            type_name_part = (
-                type_desc.split(" (")[0] if " (" in type_desc else type_desc
-            )
-            max_type_name_length = max(max_type_name_length, len(type_name_part))
-
-            # Extract operation count (e.g., "C: 7 ops" or "R: 11 ops")
-            # Format is "TypeName (X: NN ops[, part info])"
-            if " (" in type_desc and " ops" in type_desc:
-                # Extract the number between ": " and " ops"
-                parts = type_desc.split(": ")
-                if len(parts) >= 2:
-                    ops_part = parts[1].split(" ops")[0]
-                    try:
-                        op_count = int(ops_part)
-                        max_op_count_per_type = max(max_op_count_per_type, op_count)
-                    except ValueError:
-                        pass
-
-    # Calculate width needed for operation count alignment
-    op_count_width = len(str(max_op_count_per_type)) if max_op_count_per_type > 0 else 1
-
-    def format_ops_count(rest: str, width: int) -> str:
-        """Format operation count with right alignment.
-
-        Input: "C: 7 ops, 1 of 2)" or "R: 11 ops)"
-        Output: "C:  7 ops, 1 of 2)" or "R: 11 ops)" (right-aligned count)
-        """
-        if ": " in rest and " ops" in rest:
-            # Split on ": " to get prefix (C or R) and the rest
-            prefix, after_colon = rest.split(": ", 1)
-            # Split on " ops" to get the count and the suffix
-            count_str, after_ops = after_colon.split(" ops", 1)
-            # Right-align the count
-            aligned_count = count_str.rjust(width)
-            return f"{prefix}: {aligned_count} ops{after_ops}"
-        return rest
-
-    def format_type_description_line(
-        type_desc: str, max_type_name_length: int, op_count_width: int
-    ) -> str:
-        """Format a type description line with proper alignment.
-
-        Handles type names with special characters like < and > (e.g., Time<Fixed>).
-        Uses .ljust() instead of f-string formatting to avoid issues with < characters.
+# Build the log in memory and write it once
+log_lines: list[str] = []
+log_lines.append("# Mutation Test Debug Log\n")
+log_lines.append(f"# Started: {timestamp}\n")
+log_lines.append(f"# Batch Number:             {batch_num:>2}\n")
+ops_per_batch = max_subagents * ops_per_subagent
+log_lines.append(f"# Max subagents:            {max_subagents:>2}\n")
+log_lines.append(f"# Ops per Subagent:         {ops_per_subagent:>2}\n")
+log_lines.append(f"# Ops per Batch:           {ops_per_batch:>3}\n")
+log_lines.append(f"# Types remaining:         {remaining_types:>3}\n")
+log_lines.append(f"# Ports: {ports_str}\n")
+
+# Total ops for each assignment, from the in-memory plans (one per assignment)
+assignment_ops: list[int] = [
+    sum(len(test.get("operations", [])) for test in test_plan["tests"])
+    for test_plan in test_plans
+]
+
+# Find max width for right alignment
+max_ops_width = len(str(max(assignment_ops))) if assignment_ops else 1
+max_subagent_width = len(str(len(assignments)))
+
+# Calculate indentation for multi-line type lists
+# Format: "# {subagent_num} ({total_ops} ops) "
+# Total prefix length includes: "# " (2) + num + " (" (2) + ops + " ops) " (6)
+prefix_length = 2 + max_subagent_width + 2 + max_ops_width + 6
+# For continuation lines, we need prefix_length - 1 spaces after the "#"
+continuation_indent = prefix_length - 1
+
+# Find longest type name and largest per-type op count across ALL assignments
+# for global columnar alignment
+all_descriptions = [
+    description
+    for descriptions in assignment_descriptions
+    for description in descriptions
+]
+max_type_name_length = max(
+    (len(description.short_name) for description in all_descriptions), default=0
+)
+max_op_count_per_type = max(
+    (description.op_count for description in all_descriptions), default=0
+)
 
-        Args:
-            type_desc: Type description string like "Time<Fixed> (R: 7 ops, 1 of 2)"
-            max_type_name_length: Width to pad type name to
-            op_count_width: Width for operation count alignment
+# Calculate width needed for operation count alignment
+op_count_width = len(str(max_op_count_per_type)) if max_op_count_per_type > 0 else 1
+
+# Calculate max line width for test plan path alignment
+max_line_width = 0
+for idx, assignment in enumerate(assignments):
+    total_ops = assignment_ops[idx]
+    subagent_num = assignment["subagent"]
+    type_list = assignment_descriptions[idx]
+
+    if type_list:
+        padded_first = type_list[0].render(max_type_name_length, op_count_width)
+        # Calculate the full line width (without test plan path and without colon)
+        line = f"# {subagent_num:>{max_subagent_width}} ({total_ops:>{max_ops_width}} ops) {padded_first}"
+        max_line_width = max(max_line_width, len(line))
+
+# Write header line
+type_header = "Type (C=Component, R=Resource: ops, Partition)"
+# Type column should be at least the header length, but can expand if content is longer
+min_type_width = len(type_header)
+# Use actual prefix length (dynamic based on subagent/ops widths), not fixed "# Subagent    "
+actual_content_width = max_line_width - prefix_length
+type_column_width = max(min_type_width, actual_content_width)
+# Subagent column width matches the "N (XX ops)" format: N + " (" (2) + XX + " ops)" (5)
+subagent_column_width = max_subagent_width + 2 + max_ops_width + 5
+header_line = f"# {'Subagent':<{subagent_column_width}} {type_header:<{type_column_width}} Test Plan"
+log_lines.append(f"{header_line}\n")
+
+# Write separator line to visually partition columns
+subagent_separator = "=" * subagent_column_width
+# Type separator fills the entire type column width
+type_separator = "=" * type_column_width
+# Test plan separator should match the width of the test plan file path
+test_plan_path_width = len(assignments[0]["test_plan_file"]) if assignments else 29
+test_plan_separator = "=" * test_plan_path_width
+# Single space between separators (matching header layout)
+separator_line = f"# {subagent_separator} {type_separator} {test_plan_separator}"
+log_lines.append(f"{separator_line}\n")
+
+# Write formatted subagent lines
+for idx, assignment in enumerate(assignments):
+    total_ops = assignment_ops[idx]
+    subagent_num = assignment["subagent"]
+    type_list = assignment_descriptions[idx]
+    test_plan_file = assignment["test_plan_file"]
+
+    if type_list:
+        # First type on same line as subagent info
+        padded_first = type_list[0].render(max_type_name_length, op_count_width)
+        # Build line and pad to type column width before adding test plan path
+        line = f"# {subagent_num:>{max_subagent_width}} ({total_ops:>{max_ops_width}} ops) {padded_first}"
+        # Pad to match header: "# " (2) + subagent_column + " " (1) + type_column
+        total_width = 2 + subagent_column_width + 1 + type_column_width
+        padded_line = line.ljust(total_width)
+        log_lines.append(f"{padded_line} {test_plan_file}\n")
+
+        # Subsequent types indented on their own lines with columnar alignment
+        for type_desc in type_list[1:]:
+            padded_desc = type_desc.render(max_type_name_length, op_count_width)
+            log_lines.append(f"#{' ' * continuation_indent}{padded_desc}\n")
+
+# Write separator line between table and logs
+log_lines.append(f"{separator_line}\n")
 
-        Returns:
-            Formatted string with padded type name and aligned operation count
-        """
-        if " (" in type_desc:
-            type_name, rest = type_desc.split(" (", 1)
-            # Right-align operation count in the rest part
-            formatted_rest = format_ops_count(rest, op_count_width)
-            # Use .ljust() instead of f-string formatting to avoid issues with < in type names
-            return f"{type_name.ljust(max_type_name_length)} ({formatted_rest}"
-        return type_desc
-
-    # Calculate max line width for test plan path alignment
-    max_line_width = 0
-    for idx, assignment in enumerate(assignments):
-        total_ops = assignment_ops[idx]
-        subagent_num = assignment["subagent"]
-        type_list = assignment["type_descriptions"]
-
-        if type_list:
-            first_desc = type_list[0]
-            if " (" in first_desc:
-                type_name, rest = first_desc.split(" (", 1)
-                formatted_rest = format_ops_count(rest, op_count_width)
-                padded_first = f"{type_name:<{max_type_name_length}} ({formatted_rest}"
-            else:
-                padded_first = first_desc
-            # Calculate the full line width (without test plan path and without colon)
-            line = f"# {subagent_num:>{max_subagent_width}} ({total_ops:>{max_ops_width}} ops) {padded_first}"
-            max_line_width = max(max_line_width, len(line))
-
-    # Write header line
-    type_header = "Type (C=Component, R=Resource: ops, Partition)"
-    # Type column should be at least the header length, but can expand if content is longer
-    min_type_width = len(type_header)
-    # Use actual prefix length (dynamic based on subagent/ops widths), not fixed "# Subagent    "
-    actual_content_width = max_line_width - prefix_length
-    type_column_width = max(min_type_width, actual_content_width)
-    # Subagent column width matches the "N (XX ops)" format: N + " (" (2) + XX + " ops)" (5)
-    subagent_column_width = max_subagent_width + 2 + max_ops_width + 5
-    header_line = f"# {'Subagent':<{subagent_column_width}} {type_header:<{type_column_width}} Test Plan"
-    _ = f.write(f"{header_line}\n")
-
-    # Write separator line to visually partition columns
-    subagent_separator = "=" * subagent_column_width
-    # Type separator fills the entire type column width
-    type_separator = "=" * type_column_width
-    # Test plan separator should match the width of the test plan file path
-    test_plan_path_width = len(assignments[0]["test_plan_file"]) if assignments else 29
-    test_plan_separator = "=" * test_plan_path_width
-    # Single space between separators (matching header layout)
-    separator_line = f"# {subagent_separator} {type_separator} {test_plan_separator}"
-    _ = f.write(f"{separator_line}\n")
-
-    # Write formatted subagent lines
-    for idx, assignment in enumerate(assignments):
-        total_ops = assignment_ops[idx]
-        subagent_num = assignment["subagent"]
-        type_list = assignment["type_descriptions"]
-        test_plan_file = assignment["test_plan_file"]
-
-        if type_list:
-            # First type on same line as subagent info
-            first_desc = type_list[0]
-            padded_first = format_type_description_line(
-                first_desc, max_type_name_length, op_count_width
-            )
-            # Build line and pad to type column width before adding test plan path
-            line = f"# {subagent_num:>{max_subagent_width}} ({total_ops:>{max_ops_width}} ops) {padded_first}"
-            # Pad to match header: "# " (2) + subagent_column + " " (1) + type_column
-            total_width = 2 + subagent_column_width + 1 + type_column_width
-            padded_line = line.ljust(total_width)
-            _ = f.write(f"{padded_line} {test_plan_file}\n")
-
-            # Subsequent types indented on their own lines with columnar alignment
-            for type_desc in type_list[1:]:
-                padded_desc = format_type_description_line(
-                    type_desc, max_type_name_length, op_count_width
-                )
-                _ = f.write(f"#{' ' * continuation_indent}{padded_desc}\n")
-
-    # Write separator line between table and logs
-    _ = f.write(f"{separator_line}\n")
+with open(DEBUG_LOG, "w", encoding="utf-8") as f:
+    _ = f.write("".join(log_lines))
 
 print(f"Created new debug log: {DEBUG_LOG}", file=sys.stderr)
 print(f"  Batch: {batch_num}", file=sys.stderr)
@@ -1743,33 +1716,8 @@ print(f"  Ports: {ports_str}", file=sys.stderr)
 print(f"  Types count: {len(assignments)}", file=sys.stderr)
 
 # Return all assignments with test plan files generated
-# Calculate unique types that actually made it into assignments
-output_assigned_type_names: set[str] = set()
-for assignment in assignments:
-    # Open the test plan file to get the actual types assigned
-    try:
-        with open(assignment["test_plan_file"], "r") as f:
-            test_plan_raw = json.load(f)  # pyright: ignore[reportAny]
-            test_plan = cast(TestPlan, test_plan_raw)
-            for test in test_plan.get("tests", []):
-                type_name = test.get("type_name")
-                if type_name:
-                    output_assigned_type_names.add(type_name)
-    except (IOError, json.JSONDecodeError):
-        pass
-
-unique_types_count = len(output_assigned_type_names)
 subagent_count = len(assignments)
 
-# Calculate statistics for progress message
-total_batches = max(
-    (t.get("batch_number") or 0 for t in type_guide.values()), default=0
-)
-untested_count = len(
-    [t for t in type_guide.values() if t.get("test_status") == "untested"]
-)
-remaining_types = untested_count - unique_types_count  # Remaining after this batch
-
 # Generate progress message
 if unique_types_count == subagent_count:
     distribution = f"{unique_types_count} types across {subagent_count} subagents"
@@ -1790,4 +1738,7 @@ all_assignments_output: AllAssignmentsOutput = {
 # Print summary to stderr for user visibility
 print(f"✓ {distribution}", file=sys.stderr)
 
-print(json.dumps(all_assignments_output, indent=2))
+# Emit the summary as one binary write (stays indented: the mutation_test agent reads it)
+sys.stdout.flush()  # Keep any earlier text-mode output ahead of the summary
+_ = sys.stdout.buffer.write(dump_json_bytes(all_assignments_output) + b"\n")
+sys.stdout.flush()
@@ -660,9 +660,11 @@ for type_key, type_data in type_guide.items():  # pyright: ignore[reportAny]
             else:
                 type_data["fail_reason"] = ""
 
-# Write updated all_types.json
-with open(all_types_file, "w", encoding="utf-8") as f:
-    json.dump(all_types, f, indent=2)
+# Write updated all_types.json via a temp file so a failed write can't corrupt it
+all_types_tmp_file = f"{all_types_file}.tmp"
+with open(all_types_tmp_file, "w", encoding="utf-8") as f:
+    _ = f.write(json.dumps(all_types, indent=2))
+os.replace(all_types_tmp_file, all_types_file)
 
 # Count statistics:
 # PASS: In aggregated_results with status=PASS AND not in null_status_types (all parts executed)